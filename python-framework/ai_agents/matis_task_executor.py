@@ -18,12 +18,13 @@ through the ReasonOps AI agents framework.
 
 import os
 import sys
+import shutil
 import subprocess
 import tempfile
 import json
 import yaml
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -62,6 +63,8 @@ class MatisTaskExecutor:
             self.matis_binary = "e:\\Code\\ReasonOps-ITSM\\matis\\target\\release\\matis"
 
         self.execution_history: List[TaskExecutionResult] = []
+        # (binary mtime, result) of the last installation probe
+        self._validation_cache: Optional[Tuple[Optional[int], bool]] = None
 
     def _run_matis_command(self, args: List[str], cwd: Optional[str] = None) -> subprocess.CompletedProcess:
         """
@@ -111,14 +114,28 @@ class MatisTaskExecutor:
         """
         Validate that Matis is properly installed and accessible
 
+        The probe spawns the binary, so its result is cached until the
+        binary's mtime changes.
+
         Returns:
             True if Matis is available, False otherwise
         """
+        try:
+            mtime = os.stat(shutil.which(self.matis_binary) or self.matis_binary).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        if self._validation_cache is not None and self._validation_cache[0] == mtime:
+            return self._validation_cache[1]
+
         try:
             result = self._run_matis_command(["--version"])
-            return result.returncode == 0
+            available = result.returncode == 0
         except RuntimeError:
-            return False
+            available = False
+
+        self._validation_cache = (mtime, available)
+        return available
 
     def execute_playbook(self,
                         playbook_content: Union[str, Dict],
@@ -417,6 +434,33 @@ class MatisTaskExecutor:
             ]
         }
 
+    def create_sample_inventory(self) -> Dict:
+        """
+        Create a sample inventory for demonstration
+
+        Returns:
+            Inventory dictionary
+        """
+        return {
+            "all": {
+                "vars": {
+                    "ansible_user": "admin",
+                    "ansible_ssh_private_key_file": "~/.ssh/id_rsa"
+                }
+            },
+            "webservers": {
+                "hosts": {
+                    "web01": {"ansible_host": "192.168.1.10", "http_port": 80},
+                    "web02": {"ansible_host": "192.168.1.11", "http_port": 8080}
+                }
+            },
+            "dbservers": {
+                "hosts": {
+                    "db01": {"ansible_host": "192.168.1.20", "db_port": 5432}
+                }
+            }
+        }
+
     def generate_automation_playbook(self, incident_description: str, target_hosts: str = "all",
                                    automation_type: str = "incident_response") -> Dict:
         """
@@ -12,29 +12,55 @@ This module provides the foundational components of the ITIL 4 framework:
 These core components form the foundation for all ITIL practices.
 """
 
-from .service_value_system import (
+from __future__ import annotations
+
+from functools import lru_cache
+from importlib import import_module
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
+
+if TYPE_CHECKING:
+    from .service_value_system import ConfigurationItem, Person
+
+# The service value system is imported on first use, so light submodules
+# such as core.branding can be imported without it
+_LAZY_IMPORTS = {
     # Enums
-    Priority,
-    Status,
-    Impact,
-    Urgency,
+    'Priority': '.service_value_system',
+    'Status': '.service_value_system',
+    'Impact': '.service_value_system',
+    'Urgency': '.service_value_system',
     
     # Data Classes
-    Person,
-    ConfigurationItem,
+    'Person': '.service_value_system',
+    'ConfigurationItem': '.service_value_system',
     
     # Main Classes
-    ServiceValueSystem,
-    GuidingPrinciples,
-    ServiceValueChain,
-    GovernanceFramework,
-    PracticeRegistry,
-    ContinualImprovement,
-    ValueStream,
-    GovernanceBody,
-    ImprovementInitiative,
-    ImprovementModel
-)
+    'ServiceValueSystem': '.service_value_system',
+    'GuidingPrinciples': '.service_value_system',
+    'ServiceValueChain': '.service_value_system',
+    'GovernanceFramework': '.service_value_system',
+    'PracticeRegistry': '.service_value_system',
+    'ContinualImprovement': '.service_value_system',
+    'ValueStream': '.service_value_system',
+    'GovernanceBody': '.service_value_system',
+    'ImprovementInitiative': '.service_value_system',
+    'ImprovementModel': '.service_value_system',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Enums
@@ -67,6 +93,7 @@ __description__ = "Core components of the ITIL 4 Service Value System"
 
 def create_service_value_system():
     """Factory function to create a fully configured Service Value System"""
+    from .service_value_system import ServiceValueSystem
     
     # Create and configure the SVS
     svs = ServiceValueSystem()
@@ -78,20 +105,24 @@ def create_service_value_system():
 
 def get_guiding_principles():
     """Get the ITIL 4 Guiding Principles"""
+    from .service_value_system import GuidingPrinciples
     principles = GuidingPrinciples()
     return principles.get_all_principles()
 
 def get_service_value_chain_activities():
     """Get all Service Value Chain activities"""
+    from .service_value_system import ServiceValueChain
     svc = ServiceValueChain()
     return svc.get_all_activities()
 
 def create_governance_framework():
     """Create a basic governance framework"""
+    from .service_value_system import GovernanceFramework
     return GovernanceFramework()
 
 def create_continual_improvement_model():
     """Create the continual improvement model"""
+    from .service_value_system import ContinualImprovement
     return ContinualImprovement()
 
 # Framework utilities
@@ -111,9 +142,11 @@ class ITILFrameworkUtils:
                 ci.status and ci.environment)
     
     @staticmethod
-    def calculate_priority_matrix() -> dict:
-        """Get the standard ITIL priority matrix"""
-        return {
+    @lru_cache(maxsize=1)
+    def calculate_priority_matrix() -> Mapping:
+        """Get the standard ITIL priority matrix (read-only, built once on first use)"""
+        from .service_value_system import Impact, Priority, Urgency
+        return MappingProxyType({
             (Impact.HIGH, Urgency.HIGH): Priority.P1_CRITICAL,
             (Impact.HIGH, Urgency.MEDIUM): Priority.P2_HIGH,
             (Impact.HIGH, Urgency.LOW): Priority.P3_MEDIUM,
@@ -123,7 +156,7 @@ class ITILFrameworkUtils:
             (Impact.LOW, Urgency.HIGH): Priority.P3_MEDIUM,
             (Impact.LOW, Urgency.MEDIUM): Priority.P4_LOW,
             (Impact.LOW, Urgency.LOW): Priority.P4_LOW,
-        }
+        })
     
     @staticmethod
     def get_framework_overview() -> dict:
@@ -185,6 +218,8 @@ class ITILFrameworkUtils:
 
 # Example usage
 if __name__ == "__main__":
+    from .service_value_system import Impact, Priority, Urgency
+    
     print("ITIL 4 Core Module")
     print("=" * 25)
     
@@ -15,7 +15,7 @@ Run:
 from __future__ import annotations
 import sys
 import os
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Callable, Optional, Tuple, List
 from dataclasses import dataclass
 from decimal import Decimal
 from datetime import datetime, timedelta
@@ -508,19 +508,32 @@ class ITILOrchestrator:
         results["throughput_rps"] = tp
         return results
 
-    async def run_periodic_jobs(self, iterations: int = 1, interval_seconds: int = 10) -> None:
+    def record_renewals_snapshot(self) -> None:
+        due = self.suppliers.suppliers_due_for_renewal()
+        json_store.append_record("renewals", {
+            "timestamp": datetime.now(),
+            "due_count": len(due),
+        })
+
+    def apply_breach_penalties(self) -> Decimal:
+        # Penalties are derived from the breach, so these two stay in order
+        self.simulate_sla_breach()
+        return self.apply_supplier_penalties_for_breaches()
+
+    def periodic_jobs(self) -> List[Callable[[], Any]]:
+        """Independent job chains recomputed on every periodic tick."""
+        return [self.record_renewals_snapshot, self.apply_breach_penalties, self.apply_capacity_chargeback]
+
+    async def run_periodic_jobs(self, iterations: int = 1, interval_seconds: int = 10, max_concurrency: int = 8) -> None:
         """Periodic recomputation for renewals, penalties, and chargebacks."""
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def run_job(job: Callable[[], Any]) -> Any:
+            async with sem:
+                return await asyncio.to_thread(job)
+
         for i in range(iterations):
-            # Renewals snapshot
-            due = self.suppliers.suppliers_due_for_renewal()
-            json_store.append_record("renewals", {
-                "timestamp": datetime.now(),
-                "due_count": len(due),
-            })
-            # Apply penalties and chargebacks
-            self.simulate_sla_breach()
-            self.apply_supplier_penalties_for_breaches()
-            self.apply_capacity_chargeback()
+            await asyncio.gather(*(run_job(job) for job in self.periodic_jobs()))
             if i < iterations - 1:
                 await asyncio.sleep(interval_seconds)
 
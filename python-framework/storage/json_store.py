@@ -3,11 +3,14 @@ Simple JSON persistence for orchestrator events (penalties, chargebacks, KPIs).
 Serializes datetimes to ISO strings and Decimals to strings.
 """
 from __future__ import annotations
+import copy
 import json
 import os
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from enum import Enum
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 
@@ -21,6 +24,8 @@ def _default(o: Any):
         return o.isoformat()
     if isinstance(o, Decimal):
         return str(o)
+    if isinstance(o, Enum):
+        return o.value
     # dataclasses
     if hasattr(o, "__dict__"):
         return o.__dict__
@@ -31,9 +36,63 @@ def _collection_path(collection: str) -> str:
     return os.path.join(DATA_DIR, f"{collection}.json")
 
 
+def _dumps(data: Any) -> bytes:
+    """Serialize as ``json.dump(data, indent=2, default=_default)`` does.
+
+    Always the stdlib encoder: orjson differs on non-ASCII text, NaN/Infinity,
+    float exponents and key handling, and stored files must not depend on
+    which optional packages happen to be installed.
+    """
+    return json.dumps(data, default=_default, indent=2).encode("utf-8")
+
+
+def _write_atomic(path: str, payload: bytes) -> None:
+    """Replace ``path`` with ``payload`` via a temp file, so readers never see a partial file"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _append_in_place(path: str, record: Dict[str, Any]) -> bool:
+    """Splice ``record`` before the closing ``]`` of the array stored at ``path``.
+
+    Only the tail of the file is rewritten and the layout matches re-dumping
+    the whole list with ``indent=2``. Returns False when the file does not end in an
+    array so the caller can fall back to a full rewrite.
+    """
+    # Indent the element one level, as json.dump does for list items
+    body = _dumps(record).replace(b"\n", b"\n  ")
+    with open(path, "r+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        tail_start = max(0, size - 64)
+        f.seek(tail_start)
+        tail = f.read().rstrip()
+        if not tail.endswith(b"]"):
+            return False
+        head = tail[:-1].rstrip()
+        if not head:
+            return False
+        # Overwrite the old tail first and only then drop any leftover bytes, so
+        # the existing rows are never cut off before the new tail is on disk
+        f.seek(tail_start + len(head))
+        f.write((b"\n  " if head.endswith(b"[") else b",\n  ") + body + b"\n]")
+        f.flush()
+        os.fsync(f.fileno())
+        f.truncate()
+    return True
+
+
 def append_record(collection: str, record: Dict[str, Any]) -> None:
     _ensure_dir()
     path = _collection_path(collection)
+    try:
+        if os.path.getsize(path) and _append_in_place(path, record):
+            return
+    except OSError:
+        pass
     data: List[Dict[str, Any]] = []
     if os.path.exists(path):
         try:
@@ -42,8 +101,7 @@ def append_record(collection: str, record: Dict[str, Any]) -> None:
         except Exception:
             data = []
     data.append(record)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, default=_default, indent=2)
+    _write_atomic(path, _dumps(data))
 
 
 def read_all(collection: str) -> List[Dict[str, Any]]:
@@ -61,33 +119,87 @@ def read_all(collection: str) -> List[Dict[str, Any]]:
 def query(collection: str, limit: Optional[int] = None, **filters) -> List[Dict[str, Any]]:
     """Query collection with optional filters and limit"""
     data = read_all(collection)
+    if not filters:
+        return data if limit is None else data[:limit]
     
-    # Apply filters
-    if filters:
-        filtered_data = []
-        for record in data:
-            match = True
-            for key, value in filters.items():
-                if record.get(key) != value:
-                    match = False
-                    break
-            if match:
-                filtered_data.append(record)
-        data = filtered_data
-    
-    # Apply limit
-    if limit is not None:
-        data = data[:limit]
-    
-    return data
+    # Single pass over the rows, stopping as soon as ``limit`` matches are found
+    items = tuple(filters.items())
+    matches = (record for record in data if all(record.get(key) == value for key, value in items))
+    return list(islice(matches, limit))
+
+
+# (collection, field) -> (file stamp, rows, value -> position)
+_INDEX_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int], List[Dict[str, Any]], Dict[Any, int]]] = {}
+
+
+def index_by(collection: str, field: str) -> Tuple[List[Dict[str, Any]], Dict[Any, int]]:
+    """Return the collection rows plus a map of ``field`` value -> row position.
+
+    The first row wins for duplicate values. Both are cached per process and
+    rebuilt whenever the collection file's mtime or size changes. The rows are
+    the cached list itself, meant for read-modify-``save`` updates; a caller
+    that edits them must save them.
+    """
+    try:
+        st = os.stat(_collection_path(collection))
+    except OSError:
+        return [], {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _INDEX_CACHE.get((collection, field))
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
+    rows = read_all(collection)
+    index = _build_index(rows, field)
+    _INDEX_CACHE[(collection, field)] = (stamp, rows, index)
+    return rows, index
+
+
+def _build_index(rows: List[Dict[str, Any]], field: str) -> Dict[Any, int]:
+    index: Dict[Any, int] = {}
+    for pos, row in enumerate(rows):
+        try:
+            index.setdefault(row.get(field), pos)
+        except (AttributeError, TypeError):
+            continue  # Non-dict rows or unhashable values are not indexable
+    return index
+
+
+def get_by(collection: str, field: str, value: Any) -> Optional[Dict[str, Any]]:
+    """Return a copy of the first record whose ``field`` equals ``value``, or None.
+
+    The copy is the caller's own, so editing it does not touch the cached rows
+    behind later lookups; pass changes back through ``save``.
+    """
+    rows, index = index_by(collection, field)
+    pos = index.get(value)
+    return None if pos is None else copy.deepcopy(rows[pos])
 
 
 def save(collection: str, data: List[Dict[str, Any]]) -> None:
     """Save complete data to collection"""
     _ensure_dir()
     path = _collection_path(collection)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, default=_default, indent=2)
+    _write_atomic(path, _dumps(data))
+    _restamp_index(collection, path, data)
+
+
+def _restamp_index(collection: str, path: str, data: List[Dict[str, Any]]) -> None:
+    """Re-point cached indexes for ``collection`` at the rows just written.
+
+    The index is rebuilt from ``data`` in memory, so an update made through
+    ``index_by`` does not cost a re-read and re-parse of the whole file on
+    the next lookup.
+    """
+    keys = [key for key in _INDEX_CACHE if key[0] == collection]
+    if not keys:
+        return
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    stamp = (st.st_mtime_ns, st.st_size)
+    for key in keys:
+        _INDEX_CACHE[key] = (stamp, data, _build_index(data, key[1]))
 
 
 def get_agent_decisions(limit: Optional[int] = None, event_type: Optional[str] = None, agent_name: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -105,6 +217,25 @@ def month_key(dt: datetime) -> str:
     return dt.strftime("%Y-%m")
 
 
+def _accumulate(rollup: Dict[str, Any], mk: str, r: Dict[str, Any], sum_fields: List[str], group_by: Optional[List[str]]) -> None:
+    if group_by:
+        group_key = tuple(r.get(g) for g in group_by)
+        R = rollup.setdefault(mk, {})
+        G = R.setdefault(group_key, {k: 0.0 for k in sum_fields})
+        for k in sum_fields:
+            try:
+                G[k] += float(r.get(k, 0) or 0)
+            except Exception:
+                pass
+    else:
+        R = rollup.setdefault(mk, {k: 0.0 for k in sum_fields})
+        for k in sum_fields:
+            try:
+                R[k] += float(r.get(k, 0) or 0)
+            except Exception:
+                pass
+
+
 def rollup_monthly(collection: str, date_field: str, sum_fields: List[str], group_by: Optional[List[str]] = None) -> Dict[str, Any]:
     rows = read_all(collection)
     rollup: Dict[str, Any] = {}
@@ -116,21 +247,23 @@ def rollup_monthly(collection: str, date_field: str, sum_fields: List[str], grou
             ts = datetime.fromisoformat(ts_str)
         except Exception:
             continue
-        mk = month_key(ts)
-        if group_by:
-            group_key = tuple(r.get(g) for g in group_by)
-            R = rollup.setdefault(mk, {})
-            G = R.setdefault(group_key, {k: 0.0 for k in sum_fields})
-            for k in sum_fields:
-                try:
-                    G[k] += float(r.get(k, 0) or 0)
-                except Exception:
-                    pass
-        else:
-            R = rollup.setdefault(mk, {k: 0.0 for k in sum_fields})
-            for k in sum_fields:
-                try:
-                    R[k] += float(r.get(k, 0) or 0)
-                except Exception:
-                    pass
+        _accumulate(rollup, month_key(ts), r, sum_fields, group_by)
     return rollup
+
+
+def rollup_for_month(collection: str, date_field: str, sum_fields: List[str], month: str, group_by: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Roll up a single ``YYYY-MM`` month; same shape as ``rollup_monthly(...)[month]``."""
+    rows = read_all(collection)
+    rollup: Dict[str, Any] = {}
+    for r in rows:
+        ts_str = r.get(date_field)
+        # ISO timestamps start with YYYY-MM, so other months are skipped without parsing
+        if not isinstance(ts_str, str) or not ts_str.startswith(month):
+            continue
+        try:
+            ts = datetime.fromisoformat(ts_str)
+        except Exception:
+            continue
+        if month_key(ts) == month:
+            _accumulate(rollup, month, r, sum_fields, group_by)
+    return rollup.get(month, {})
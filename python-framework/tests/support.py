@@ -0,0 +1,33 @@
+"""Shared fixtures for the CLI and storage tests"""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+class TempDirTestCase(unittest.TestCase):
+    """Gives every test a fresh temporary directory as ``self.root``, removed afterwards"""
+
+    def setUp(self):
+        super().setUp()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+    def patch(self, target, attribute, value):
+        """Set ``target.attribute`` to ``value`` for the duration of the test"""
+        patcher = mock.patch.object(target, attribute, value)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+
+class StubAgentsOrchestrator:
+    """Stands in for the agents orchestrator, answering ``handle_event`` and counting calls"""
+
+    def __init__(self, result=None):
+        self.calls = []
+        self.result = result
+
+    async def handle_event(self, event_type, event_data):
+        self.calls.append((event_type, event_data))
+        return self.result or {"event_type": event_type, "decisions": [event_data], "actions": []}
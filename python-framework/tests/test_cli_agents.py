@@ -0,0 +1,77 @@
+import io
+import json
+import unittest
+from unittest import mock
+
+import cli
+from tests.support import StubAgentsOrchestrator, TempDirTestCase
+
+
+class TestEventDataLoading(TempDirTestCase):
+    def test_inline_and_file_payloads(self):
+        self.assertEqual(cli._load_event_data('{"incident_id": "INC1"}'), {"incident_id": "INC1"})
+        event = self.root / "event.json"
+        event.write_text('{"severity": "high"}', encoding="utf-8")
+        self.assertEqual(cli._load_event_data(f"@{event}"), {"severity": "high"})
+
+    def test_oversized_payloads_are_rejected_before_parsing(self):
+        event = self.root / "event.json"
+        event.write_text('{"blob": "' + "x" * 64 + '"}', encoding="utf-8")
+        with mock.patch.object(cli, "MAX_EVENT_DATA_BYTES", 32):
+            with self.assertRaises(cli.EventDataTooLarge):
+                cli._load_event_data(f"@{event}")
+            with self.assertRaises(cli.EventDataTooLarge):
+                cli._load_event_data('{"blob": "' + "x" * 64 + '"}')
+
+
+class TestLlmConfigOption(unittest.TestCase):
+    def test_missing_llm_config_is_an_error(self):
+        args = cli.argparse.Namespace(llm_config="/nonexistent/providers.yml")
+        with mock.patch.object(cli, "_agents_orchestrator") as build, \
+                mock.patch("sys.stderr"), self.assertRaises(SystemExit) as exit_:
+            cli._agents_orchestrator_for(args)
+        self.assertEqual(exit_.exception.code, 1)
+        build.assert_not_called()
+
+
+class TestAgentsShell(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.orchestrator = StubAgentsOrchestrator()
+        self.patch(cli, "_agents_orchestrator", lambda llm_config_file=None: self.orchestrator)
+        self.patch(cli, "AGENT_RESPONSE_CACHE_DIR", self.root / "agent_responses")
+
+    def _run(self, stdin, cache=False):
+        out = io.StringIO()
+        with mock.patch("sys.stdin", io.StringIO(stdin)), mock.patch("sys.stdout", out):
+            cli.cmd_agents_shell(cli.argparse.Namespace(llm_config=None, cache=cache))
+        return [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_each_event_is_dispatched_and_answered_in_order(self):
+        rows = self._run(
+            '{"event_type": "incident", "event_data": {"id": "INC1"}}\n'
+            '\n'
+            '{"event_type": "change", "event_data": {"id": "CHG1"}}\n'
+        )
+        self.assertEqual(rows, [
+            {"event_type": "incident", "result": {"event_type": "incident", "decisions": [{"id": "INC1"}], "actions": []}},
+            {"event_type": "change", "result": {"event_type": "change", "decisions": [{"id": "CHG1"}], "actions": []}},
+        ])
+        self.assertEqual(self.orchestrator.calls, [("incident", {"id": "INC1"}), ("change", {"id": "CHG1"})])
+
+    def test_bad_line_reports_an_error_and_the_shell_continues(self):
+        rows = self._run('not json\n{"event_data": {}}\n{"event_type": "incident"}\n')
+        self.assertIn("error", rows[0])
+        self.assertEqual(rows[1]["event_type"], None)
+        self.assertIn("error", rows[1])
+        self.assertEqual(rows[2], {"event_type": "incident", "result": {"event_type": "incident", "decisions": [{}], "actions": []}})
+
+    def test_cache_flag_reuses_answers_across_lines(self):
+        line = '{"event_type": "incident", "event_data": {"id": "INC1"}}\n'
+        rows = self._run(line * 2, cache=True)
+        self.assertEqual(rows[0], rows[1])
+        self.assertEqual(len(self.orchestrator.calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
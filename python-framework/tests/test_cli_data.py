@@ -0,0 +1,138 @@
+import os
+import shutil
+import tarfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+import cli
+from tests.support import TempDirTestCase
+
+
+class TestDataBackupHelpers(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.src = self.root / "src"
+        (self.src / "nested" / "deeper").mkdir(parents=True)
+        (self.src / "a.json").write_text('{"a": 1}', encoding="utf-8")
+        (self.src / "nested" / "b.json").write_text('{"b": 2}', encoding="utf-8")
+        (self.src / "nested" / "deeper" / "c.log").write_text("line\n" * 200, encoding="utf-8")
+        (self.src / "empty").mkdir()
+
+    def _relative_files(self, base: Path):
+        return sorted(str(p.relative_to(base)) for p in base.rglob("*") if p.is_file())
+
+    def test_parallel_copytree_copies_all_files_and_dirs(self):
+        dst = self.root / "dst"
+        cli._parallel_copytree(self.src, dst, workers=2)
+        self.assertEqual(self._relative_files(self.src), self._relative_files(dst))
+        self.assertTrue((dst / "empty").is_dir())
+        self.assertEqual((dst / "nested" / "b.json").read_text(encoding="utf-8"), '{"b": 2}')
+
+    def test_parallel_copytree_preserves_mtime_and_merges_into_existing(self):
+        os.utime(self.src / "a.json", (1_000_000_000, 1_000_000_000))
+        dst = self.root / "dst"
+        dst.mkdir()
+        (dst / "existing.json").write_text("[]", encoding="utf-8")
+        cli._parallel_copytree(self.src, dst)
+        self.assertEqual(int((dst / "a.json").stat().st_mtime), 1_000_000_000)
+        self.assertTrue((dst / "existing.json").exists())
+
+    def test_parallel_copytree_keeps_mode_and_follows_symlinks(self):
+        os.chmod(self.src / "a.json", 0o640)
+        os.symlink(self.src / "nested" / "b.json", self.src / "link.json")
+        os.symlink(self.src / "nested", self.src / "linked_dir")
+        dst = self.root / "dst"
+        cli._parallel_copytree(self.src, dst)
+        self.assertEqual((dst / "a.json").stat().st_mode & 0o777, 0o640)
+        self.assertFalse((dst / "link.json").is_symlink())
+        self.assertEqual((dst / "link.json").read_text(encoding="utf-8"), '{"b": 2}')
+        self.assertEqual((dst / "linked_dir" / "b.json").read_text(encoding="utf-8"), '{"b": 2}')
+
+    def test_parallel_rmtree_removes_whole_tree(self):
+        cli._parallel_rmtree(self.src, workers=4)
+        self.assertFalse(self.src.exists())
+
+    def test_fast_copyfile_copies_contents(self):
+        payload = os.urandom(256 * 1024)
+        src = self.root / "blob.bin"
+        src.write_bytes(payload)
+        dst = self.root / "blob.copy"
+        cli._fast_copyfile(str(src), str(dst))
+        self.assertEqual(dst.read_bytes(), payload)
+
+    def test_parallel_zip_produces_valid_archive(self):
+        zip_path = self.root / "backup.zip"
+        cli._parallel_zip(self.src, zip_path, workers=2)
+        with zipfile.ZipFile(zip_path) as zf:
+            self.assertIsNone(zf.testzip())
+            self.assertEqual(sorted(zf.namelist()), ["a.json", "nested/b.json", "nested/deeper/c.log"])
+            self.assertEqual(zf.read("nested/deeper/c.log"), b"line\n" * 200)
+            self.assertEqual(zf.getinfo("a.json").compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(zf.getinfo("nested/deeper/c.log").compress_type, zipfile.ZIP_DEFLATED)
+
+    def test_parallel_zip_streams_large_files_in_order(self):
+        names = [f"f{i:02d}.log" for i in range(20)]
+        for i, name in enumerate(names):
+            (self.src / name).write_bytes(bytes([65 + i]) * (64 if i % 3 else 4096))
+        zip_path = self.root / "backup.zip"
+        with mock.patch.object(cli, "ZIP_STREAM_THRESHOLD", 1024):
+            cli._parallel_zip(self.src, zip_path, workers=2)
+        with zipfile.ZipFile(zip_path) as zf:
+            self.assertIsNone(zf.testzip())
+            for i, name in enumerate(names):
+                self.assertEqual(zf.read(name), bytes([65 + i]) * (64 if i % 3 else 4096))
+
+    def test_parallel_zip_includes_symlinked_files(self):
+        os.symlink(self.src / "nested" / "b.json", self.src / "link.json")
+        zip_path = self.root / "backup.zip"
+        cli._parallel_zip(self.src, zip_path)
+        with zipfile.ZipFile(zip_path) as zf:
+            self.assertEqual(zf.read("link.json"), b'{"b": 2}')
+
+    def test_parallel_unzip_round_trips_backup(self):
+        zip_path = self.root / "backup.zip"
+        cli._parallel_zip(self.src, zip_path)
+        dst = self.root / "restored"
+        cli._parallel_unzip(zip_path, dst, workers=3)
+        self.assertEqual(self._relative_files(self.src), self._relative_files(dst))
+        self.assertEqual((dst / "nested" / "deeper" / "c.log").read_text(encoding="utf-8"), "line\n" * 200)
+
+    def test_parallel_zip_digest_matches_archive_bytes(self):
+        zip_path = self.root / "backup.zip"
+        digest = cli._parallel_zip(self.src, zip_path)
+        cli._digest_path(zip_path).write_text(digest + "\n", encoding="utf-8")
+        self.assertTrue(cli._verify_backup_digest(zip_path))
+
+        with open(zip_path, "r+b") as f:
+            f.seek(10)
+            f.write(b"\xff")
+        self.assertFalse(cli._verify_backup_digest(zip_path))
+
+    def test_verify_backup_digest_without_sidecar(self):
+        zip_path = self.root / "backup.zip"
+        cli._parallel_zip(self.src, zip_path)
+        self.assertIsNone(cli._verify_backup_digest(zip_path))
+
+    @unittest.skipUnless(shutil.which("pigz") and shutil.which("tar"), "pigz/tar not installed")
+    def test_pigz_tar_round_trips_backup(self):
+        tar_path = self.root / "backup.tar.gz"
+        cli._pigz_tar(self.src, tar_path, shutil.which("pigz"), shutil.which("tar"))
+        dst = self.root / "restored"
+        dst.mkdir()
+        cli._extract_tar(tar_path, dst)
+        self.assertEqual(self._relative_files(self.src), self._relative_files(dst))
+
+    def test_extract_tar_restores_gzip_tarball(self):
+        tar_path = self.root / "backup.tar.gz"
+        with tarfile.open(tar_path, "w:gz") as tf:
+            tf.add(self.src, arcname=".")
+        dst = self.root / "restored"
+        dst.mkdir()
+        cli._extract_tar(tar_path, dst)
+        self.assertEqual(self._relative_files(self.src), self._relative_files(dst))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import cli
+from tests.support import StubAgentsOrchestrator, TempDirTestCase
+
+
+class TestHealthProbeCache(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patch(cli, "HEALTH_CACHE_FILE", self.root / "cache" / "health.json")
+
+    def test_fresh_entry_is_returned(self):
+        result = {"status": "healthy", "latency_ms": 12.5}
+        cli._write_health_cache("http://localhost:11434|deepseek-coder", result)
+        self.assertEqual(cli._read_health_cache("http://localhost:11434|deepseek-coder"), result)
+        self.assertIsNone(cli._read_health_cache("http://other:11434|deepseek-coder"))
+
+    def test_expired_entry_is_ignored(self):
+        cli._write_health_cache("key", {"status": "healthy"})
+        with mock.patch.object(cli.time, "time", return_value=cli.time.time() + cli.HEALTH_CACHE_TTL + 1):
+            self.assertIsNone(cli._read_health_cache("key"))
+
+    def test_custom_ttl(self):
+        cli._write_health_cache("system-status", {"storage": {"status": "healthy"}})
+        later = cli.time.time() + cli.SYSTEM_STATUS_CACHE_TTL + 1
+        with mock.patch.object(cli.time, "time", return_value=later):
+            self.assertIsNone(cli._read_health_cache("system-status", ttl=cli.SYSTEM_STATUS_CACHE_TTL))
+            self.assertIsNotNone(cli._read_health_cache("system-status"))
+
+    def test_system_status_cache_is_per_data_directory(self):
+        args = cli.argparse.Namespace(no_cache=False, json=True)
+        checks = {name: mock.patch.object(cli, name, return_value={"status": "healthy"})
+                  for name in ("_check_storage_health", "_check_orchestrator_health", "_check_agents_health")}
+        with checks["_check_storage_health"] as storage, checks["_check_orchestrator_health"], \
+                checks["_check_agents_health"], mock.patch.object(cli, "print_json"):
+            for data_dir in ("one", "two", "one"):
+                with mock.patch.object(cli.json_store, "DATA_DIR", str(self.root / data_dir)):
+                    cli.cmd_system_status(args)
+        self.assertEqual(storage.call_count, 2)
+
+    def _probe(self, manager):
+        async def probe():
+            import asyncio
+            provider = mock.Mock(value="ollama")
+            return await cli._check_provider("ollama", provider, "llama2", "http://localhost:11434", asyncio.Semaphore(1))
+        with mock.patch.object(cli, "_llm_health_manager", return_value=manager):
+            return cli._run_async(probe())
+
+    def test_healthy_probe_is_cached_and_marked(self):
+        manager = mock.Mock(generate_response=mock.AsyncMock(return_value=mock.Mock(content="OK")))
+        self.assertNotIn("cached", self._probe(manager))
+        again = self._probe(manager)
+        self.assertTrue(again["cached"])
+        self.assertEqual(again["status"], "healthy")
+        self.assertEqual(manager.generate_response.await_count, 1)
+
+    def test_failed_probe_is_not_cached(self):
+        manager = mock.Mock(generate_response=mock.AsyncMock(side_effect=ConnectionError("refused")))
+        self.assertEqual(self._probe(manager)["status"], "unhealthy")
+        self.assertEqual(self._probe(manager)["status"], "unhealthy")
+        self.assertEqual(manager.generate_response.await_count, 2)
+
+    def test_missing_or_corrupt_cache_is_a_miss(self):
+        self.assertIsNone(cli._read_health_cache("key"))
+        cli.HEALTH_CACHE_FILE.parent.mkdir(parents=True)
+        cli.HEALTH_CACHE_FILE.write_text("not json", encoding="utf-8")
+        self.assertIsNone(cli._read_health_cache("key"))
+
+
+class TestCacheFiles(TempDirTestCase):
+    def test_cache_dir_honours_xdg_cache_home(self):
+        with mock.patch.dict(cli.os.environ, {"XDG_CACHE_HOME": str(self.root)}):
+            self.assertEqual(cli._cache_dir("health.json"), self.root / "reasonops" / "health.json")
+
+    def test_atomic_write_creates_parents_and_leaves_no_temp_file(self):
+        path = self.root / "a" / "b" / "entry.json"
+        cli._atomic_write_bytes(path, b"{}")
+        self.assertEqual(path.read_bytes(), b"{}")
+        self.assertEqual(list(path.parent.iterdir()), [path])
+
+
+class TestAgentResponseCache(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patch(cli, "AGENT_RESPONSE_CACHE_DIR", self.root / "agent_responses")
+
+    def test_key_ignores_dict_order(self):
+        self.assertEqual(
+            cli._agent_response_key("incident", {"a": 1, "b": 2}, None),
+            cli._agent_response_key("incident", {"b": 2, "a": 1}, None),
+        )
+
+    def test_key_follows_llm_config_contents(self):
+        config = self.root / "providers.yml"
+        config.write_text("provider: ollama\n", encoding="utf-8")
+        before = cli._agent_response_key("incident", {"a": 1}, str(config))
+        self.assertNotEqual(before, cli._agent_response_key("incident", {"a": 1}, None))
+        config.write_text("provider: openai\n", encoding="utf-8")
+        self.assertNotEqual(before, cli._agent_response_key("incident", {"a": 1}, str(config)))
+
+    def test_cache_is_opt_in(self):
+        orch = StubAgentsOrchestrator()
+        cli._run_async(cli._handle_agent_event(orch, "incident", {"id": "INC1"}))
+        cli._run_async(cli._handle_agent_event(orch, "incident", {"id": "INC1"}))
+        self.assertEqual(len(orch.calls), 2)
+
+    def test_repeat_event_is_served_from_cache(self):
+        orch = StubAgentsOrchestrator()
+        first = cli._run_async(cli._handle_agent_event(orch, "incident", {"id": "INC1"}, use_cache=True))
+        second = cli._run_async(cli._handle_agent_event(orch, "incident", {"id": "INC1"}, use_cache=True))
+        self.assertEqual(first, second)
+        self.assertEqual(len(orch.calls), 1)
+
+        cli._run_async(cli._handle_agent_event(orch, "incident", {"id": "INC2"}, use_cache=True))
+        self.assertEqual(len(orch.calls), 2)
+
+    def test_error_results_are_not_cached(self):
+        orch = StubAgentsOrchestrator(result={"error": "provider unavailable"})
+        for _ in range(2):
+            cli._run_async(cli._handle_agent_event(orch, "incident", {"id": "INC1"}, use_cache=True))
+        self.assertEqual(len(orch.calls), 2)
+
+    def test_expired_response_is_ignored(self):
+        key = cli._agent_response_key("incident", {}, None)
+        cli._write_agent_response(key, {"decisions": []})
+        with mock.patch.object(cli.time, "time", return_value=cli.time.time() + cli.AGENT_RESPONSE_CACHE_TTL + 1):
+            self.assertIsNone(cli._read_agent_response(key))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import datetime
+import io
+import json
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+import cli
+from tests.support import TempDirTestCase
+
+
+class _Record:
+    def __init__(self):
+        self.name = "web-01"
+        self.seen = datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+
+class TestJsonOutput(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.out = self.root / "reports" / "out.json"
+
+    def _written(self, data):
+        cli.write_output(data, str(self.out))
+        return json.loads(self.out.read_text(encoding="utf-8"))
+
+    def test_write_output_handles_datetimes_objects_and_decimals(self):
+        data = {"when": datetime.datetime(2024, 1, 1), "cost": Decimal("1.50"), "ci": _Record()}
+        self.assertEqual(self._written(data), {
+            "when": "2024-01-01T00:00:00",
+            "cost": "1.50",
+            "ci": {"name": "web-01", "seen": "2024-01-02T03:04:05"},
+        })
+
+    def test_write_output_stringifies_non_str_keys(self):
+        self.assertEqual(self._written({1: "a", (1, 2): "b"}), {"1": "a", "(1, 2)": "b"})
+
+    def test_stdlib_path_matches_when_orjson_is_unavailable(self):
+        data = {"when": datetime.datetime(2024, 1, 1), "cost": Decimal("1.50"), "ci": _Record(), (1, 2): "b"}
+        expected = self._written(data)
+        with mock.patch.object(cli, "ORJSON_AVAILABLE", False):
+            self.assertEqual(self._written(data), expected)
+
+    def test_stdlib_encoding_keeps_non_ascii_text(self):
+        data = {"site": "Zürich", "owner": "José"}
+        expected = cli._dumps_bytes(data)
+        with mock.patch.object(cli, "ORJSON_AVAILABLE", False):
+            self.assertEqual(cli._dumps_bytes(data), expected)
+            self.assertEqual(cli._dumps_line(data), b'{"site": "Z\xc3\xbcrich", "owner": "Jos\xc3\xa9"}\n')
+
+    def test_print_ndjson_writes_one_record_per_line(self):
+        rows = [{"id": 1, "when": datetime.datetime(2024, 1, 1)}, {"id": 2, (1, 2): "t"}]
+        buf = io.StringIO()
+        with mock.patch("sys.stdout", buf):
+            cli.print_ndjson(iter(rows))
+        lines = buf.getvalue().splitlines()
+        self.assertEqual([json.loads(line) for line in lines],
+                         [{"id": 1, "when": "2024-01-01T00:00:00"}, {"id": 2, "(1, 2)": "t"}])
+
+
+class TestSecurityAudit(unittest.TestCase):
+    def _findings(self, audit_type):
+        with mock.patch.object(cli, "print_json") as printed:
+            cli.cmd_security_audit(cli.argparse.Namespace(type=audit_type, json=True))
+        return printed.call_args.args[0]["findings"]
+
+    def test_reports_do_not_share_finding_rows(self):
+        for audit_type in ("access", None):
+            first = self._findings(audit_type)
+            expected = [dict(finding) for finding in first]
+            first[0]["count"] = 999
+            first.append({"severity": "high", "finding": "injected", "count": 1})
+            self.assertEqual(self._findings(audit_type), expected)
+
+
+class TestTableCells(unittest.TestCase):
+    def test_shorten_marks_only_cut_text(self):
+        self.assertEqual(cli._shorten("x" * 40, 40), "x" * 40)
+        self.assertEqual(cli._shorten("x" * 41, 40), "x" * 40 + "...")
+        self.assertEqual(cli._shorten(None, 40), "N/A")
+
+    def test_date_part(self):
+        self.assertEqual(cli._date_part("2024-05-01T10:00:00"), "2024-05-01")
+        self.assertEqual(cli._date_part(None), "N/A")
+
+
+
+if __name__ == '__main__':
+    unittest.main()
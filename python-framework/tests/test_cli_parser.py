@@ -0,0 +1,41 @@
+import argparse
+import unittest
+
+import cli
+
+
+def _commands(parser):
+    action = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+    return list(action.choices)
+
+
+class TestBuildParser(unittest.TestCase):
+    def test_only_requested_group_is_built(self):
+        parser = cli.build_parser(["data", "backup", "--compress"])
+        self.assertEqual(_commands(parser), ["data"])
+        args = parser.parse_args(["data", "backup", "--compress"])
+        self.assertIs(args.func, cli.cmd_data_backup)
+        self.assertTrue(args.compress)
+
+    def test_help_and_unknown_commands_build_full_tree(self):
+        self.assertEqual(_commands(cli.build_parser([])), list(cli._COMMAND_PARSERS))
+        self.assertEqual(_commands(cli.build_parser(["--help"])), list(cli._COMMAND_PARSERS))
+        self.assertEqual(_commands(cli.build_parser(["bogus"])), list(cli._COMMAND_PARSERS))
+        self.assertEqual(_commands(cli.build_parser(["-h", "data"])), list(cli._COMMAND_PARSERS))
+
+    def test_leading_global_options_are_skipped(self):
+        parser = cli.build_parser(["--fresh", "jobs", "list"])
+        self.assertEqual(_commands(parser), ["jobs"])
+        self.assertTrue(parser.parse_args(["--fresh", "jobs", "list"]).fresh)
+
+    def test_parser_is_reused_per_group(self):
+        self.assertIs(cli.build_parser(["jobs", "run"]), cli.build_parser(["--fresh", "jobs", "list"]))
+        self.assertIsNot(cli.build_parser(["jobs", "list"]), cli.build_parser())
+        parser = cli.build_parser(["jobs", "list"])
+        self.assertFalse(parser.parse_args(["jobs", "list"]).fresh)
+        self.assertTrue(parser.parse_args(["--fresh", "jobs", "list"]).fresh)
+        self.assertFalse(parser.parse_args(["jobs", "list"]).fresh)
+
+
+if __name__ == '__main__':
+    unittest.main()
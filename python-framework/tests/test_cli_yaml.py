@@ -0,0 +1,50 @@
+import datetime
+import os
+import unittest
+from unittest import mock
+
+import cli
+from tests.support import TempDirTestCase
+
+
+class TestYamlPlaybookCache(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.playbook = self.root / "playbook.yml"
+        self.playbook.write_text("name: demo\nhosts: all\ntasks:\n- name: ping\n  command: echo ok\n", encoding="utf-8")
+        self.patch(cli, "YAML_CACHE_DIR", self.root / "cache")
+
+    def test_second_load_is_served_from_cache(self):
+        first = cli._load_yaml_cached(self.playbook)
+        self.assertEqual(first["name"], "demo")
+
+        with mock.patch.object(cli, "_load_yaml", side_effect=AssertionError("should not parse")):
+            self.assertEqual(cli._load_yaml_cached(self.playbook), first)
+
+    def test_modified_file_is_reparsed(self):
+        cli._load_yaml_cached(self.playbook)
+        self.playbook.write_text("name: changed\nhosts: web\ntasks: []\n", encoding="utf-8")
+        st = self.playbook.stat()
+        os.utime(self.playbook, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(cli._load_yaml_cached(self.playbook)["name"], "changed")
+
+    def test_callers_get_their_own_copy(self):
+        cli._load_yaml_cached(self.playbook)["tasks"].clear()
+        self.assertEqual(len(cli._load_yaml_cached(self.playbook)["tasks"]), 1)
+
+    def test_documents_json_cannot_represent_are_not_cached(self):
+        self.playbook.write_text("name: dated\nwhen: 2024-01-02\n1: int key\n", encoding="utf-8")
+        self.assertEqual(cli._load_yaml_cached(self.playbook)["when"], datetime.date(2024, 1, 2))
+        self.assertFalse((self.root / "cache").exists())
+
+    def test_cache_keeps_at_most_max_entries(self):
+        self.patch(cli, "YAML_CACHE_MAX_ENTRIES", 2)
+        for i in range(4):
+            path = self.root / f"play{i}.yml"
+            path.write_text(f"name: play{i}\n", encoding="utf-8")
+            cli._load_yaml_cached(path)
+        self.assertEqual(len(list((self.root / "cache").glob("*.json"))), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
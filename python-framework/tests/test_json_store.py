@@ -0,0 +1,146 @@
+import enum
+import json
+import math
+import os
+import unittest
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from unittest import mock
+
+from storage import json_store
+from tests.support import TempDirTestCase
+
+
+class TestIndexedLookups(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patch(json_store, "DATA_DIR", str(self.root))
+        self.addCleanup(json_store._INDEX_CACHE.clear)
+        json_store.save("incidents", [
+            {"number": "INC1", "state": "new"},
+            {"number": "INC2", "state": "closed"},
+            {"number": "INC1", "state": "duplicate"},
+        ])
+
+    def test_get_by_returns_first_match(self):
+        self.assertEqual(json_store.get_by("incidents", "number", "INC1")["state"], "new")
+        self.assertEqual(json_store.get_by("incidents", "number", "INC2")["state"], "closed")
+        self.assertIsNone(json_store.get_by("incidents", "number", "INC9"))
+        self.assertIsNone(json_store.get_by("missing", "number", "INC1"))
+
+    def test_get_by_returns_a_copy(self):
+        record = json_store.get_by("incidents", "number", "INC2")
+        record["state"] = "edited"
+        self.assertEqual(json_store.get_by("incidents", "number", "INC2")["state"], "closed")
+        rows, index = json_store.index_by("incidents", "number")
+        self.assertEqual(rows[index["INC2"]]["state"], "closed")
+
+    def test_save_keeps_index_without_rereading(self):
+        rows, index = json_store.index_by("incidents", "number")
+        rows[index["INC2"]]["number"] = "INC2-renamed"
+        json_store.save("incidents", rows)
+        with mock.patch.object(json_store, "read_all", side_effect=AssertionError("should not re-read")):
+            self.assertEqual(json_store.get_by("incidents", "number", "INC2-renamed")["state"], "closed")
+            self.assertIsNone(json_store.get_by("incidents", "number", "INC2"))
+
+    def test_index_is_rebuilt_after_save(self):
+        rows, index = json_store.index_by("incidents", "number")
+        rows[index["INC2"]]["state"] = "resolved"
+        json_store.save("incidents", rows + [{"number": "INC3", "state": "new"}])
+        path = json_store._collection_path("incidents")
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        self.assertEqual(json_store.get_by("incidents", "number", "INC2")["state"], "resolved")
+        self.assertEqual(json_store.get_by("incidents", "number", "INC3")["state"], "new")
+
+
+class _Severity(enum.Enum):
+    HIGH = "high"
+
+
+@dataclass
+class _Owner:
+    name: str
+    since: datetime
+
+
+def _awkward_rows():
+    return [
+        {"site": "Zürich", "owner": "José", "note": "漢字"},
+        {"ratio": math.nan, "limit": math.inf, "tiny": 1e-07, "big": 1e16},
+        {"severity": _Severity.HIGH, "cost": Decimal("1.50"), "at": datetime(2024, 1, 2, 3, 4, 5)},
+        {"owner": _Owner("ops", datetime(2024, 1, 1)), 1: "int key"},
+    ]
+
+
+class TestStoredFormat(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patch(json_store, "DATA_DIR", str(self.root))
+
+    def _raw(self, collection):
+        with open(json_store._collection_path(collection), "rb") as f:
+            return f.read()
+
+    def test_save_writes_the_stdlib_format(self):
+        rows = _awkward_rows()
+        json_store.save("rows", rows)
+        expected = json.dumps(rows, default=json_store._default, indent=2).encode("utf-8")
+        self.assertEqual(self._raw("rows"), expected)
+        self.assertIn(b"\\u00fc", expected)
+        self.assertIn(b"NaN", expected)
+        self.assertIn(b'"severity": "high"', expected)
+
+    def test_appends_match_a_full_save_for_awkward_values(self):
+        rows = _awkward_rows()
+        json_store.save("expected", rows)
+        json_store.save("appended", [])
+        for row in rows:
+            json_store.append_record("appended", row)
+        self.assertEqual(self._raw("appended"), self._raw("expected"))
+
+    def test_save_leaves_no_temp_files(self):
+        json_store.save("rows", [{"id": 1}])
+        json_store.save("rows", [{"id": 2}])
+        self.assertEqual(os.listdir(self.root), ["rows.json"])
+        self.assertEqual(json_store.read_all("rows"), [{"id": 2}])
+
+
+class TestAppendRecord(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patch(json_store, "DATA_DIR", str(self.root))
+
+    def _raw(self, collection):
+        with open(json_store._collection_path(collection), encoding="utf-8") as f:
+            return f.read()
+
+    def test_appends_match_a_full_save(self):
+        rows = [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "nested": {"k": None}}, {"id": 3}]
+        json_store.save("expected", rows)
+        for row in rows:
+            json_store.append_record("appended", row)
+        self.assertEqual(json_store.read_all("appended"), rows)
+        self.assertEqual(self._raw("appended"), self._raw("expected"))
+
+    def test_append_to_empty_list(self):
+        json_store.save("empty", [])
+        json_store.append_record("empty", {"id": 1})
+        self.assertEqual(json_store.read_all("empty"), [{"id": 1}])
+
+
+    def test_query_applies_filters_before_limit(self):
+        json_store.save("changes", [
+            {"number": f"CHG{i}", "status": "open" if i % 2 else "closed", "type": "normal"}
+            for i in range(10)
+        ])
+        rows = json_store.query("changes", limit=3, status="open", type="normal")
+        self.assertEqual([r["number"] for r in rows], ["CHG1", "CHG3", "CHG5"])
+        self.assertEqual(len(json_store.query("changes", status="closed")), 5)
+        self.assertEqual(len(json_store.query("changes", limit=4)), 4)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
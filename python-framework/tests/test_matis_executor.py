@@ -0,0 +1,42 @@
+import os
+import stat
+import unittest
+
+from ai_agents.matis_task_executor import MatisTaskExecutor
+from tests.support import TempDirTestCase
+
+
+@unittest.skipIf(os.name == "nt", "uses a POSIX shell script as the fake binary")
+class TestMatisInstallationProbe(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.counter = os.path.join(self.root, "calls")
+        self.binary = os.path.join(self.root, "matis")
+        with open(self.binary, "w") as f:
+            f.write(f"#!/bin/sh\necho x >> {self.counter}\nexit 0\n")
+        os.chmod(self.binary, os.stat(self.binary).st_mode | stat.S_IEXEC)
+
+    def _calls(self):
+        if not os.path.exists(self.counter):
+            return 0
+        with open(self.counter) as f:
+            return len(f.readlines())
+
+    def test_probe_is_cached_until_binary_changes(self):
+        executor = MatisTaskExecutor(self.binary)
+        self.assertTrue(executor.validate_matis_installation())
+        self.assertTrue(executor.validate_matis_installation())
+        self.assertEqual(self._calls(), 1)
+
+        st = os.stat(self.binary)
+        os.utime(self.binary, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertTrue(executor.validate_matis_installation())
+        self.assertEqual(self._calls(), 2)
+
+    def test_missing_binary_reports_unavailable(self):
+        executor = MatisTaskExecutor(os.path.join(self.root, "does-not-exist"))
+        self.assertFalse(executor.validate_matis_installation())
+
+
+if __name__ == '__main__':
+    unittest.main()
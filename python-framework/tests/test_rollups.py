@@ -36,6 +36,16 @@ class TestMonthlyRollupsAndDashboard(unittest.TestCase):
         self.assertGreaterEqual(total_pen, 0.0)
         self.assertGreater(total_chg, 0.0)
 
+    def test_rollup_for_month_matches_full_rollup(self):
+        for ts, service, amount in (("2024-01-05T10:00:00", "A", 1.5), ("2024-01-20T10:00:00", "A", 2.0),
+                                    ("2024-02-01T00:00:00", "A", 7.0), ("2024-01-31T23:59:59", "B", 4.0)):
+            json_store.append_record("chargebacks", {"timestamp": ts, "service": service, "amount": amount})
+        full = json_store.rollup_monthly("chargebacks", "timestamp", ["amount"], group_by=["service"])
+        jan = json_store.rollup_for_month("chargebacks", "timestamp", ["amount"], "2024-01", group_by=["service"])
+        self.assertEqual(jan, full["2024-01"])
+        self.assertEqual(jan[("A",)]["amount"], 3.5)
+        self.assertEqual(json_store.rollup_for_month("chargebacks", "timestamp", ["amount"], "2023-12"), {})
+
     def test_dashboard_structure_and_values(self):
         orch = ITILOrchestrator()
         dash = orch.build_integrated_dashboard()